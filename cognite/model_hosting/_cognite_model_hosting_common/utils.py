@@ -1,36 +1,31 @@
-import re
 import time
 from datetime import datetime, timedelta, timezone
-from typing import List, Tuple, Union
+from functools import lru_cache
+from typing import Iterable, List, Tuple, Union
 
 
 def calculate_windows(start: int, end: int, stride: int, window_size: int, first: int) -> List[Tuple[int, int]]:
     next = max(start, first)
     if (next - first) % stride != 0:
         next += stride - ((start - first) % stride)
-    windows = []
-    while next < end:
-        windows.append((next - window_size, next))
-        next += stride
-    return windows
+    return [(t - window_size, t) for t in range(next, end, stride)]
 
 
 _unit_in_ms_without_week = {"s": 1000, "m": 60000, "h": 3600000, "d": 86400000}
 _unit_in_ms = {**_unit_in_ms_without_week, "w": 604800000}
 
 
-def _time_string_to_ms(pattern, string, unit_in_ms):
-    pattern = pattern.format("|".join(unit_in_ms))
-    res = re.fullmatch(pattern, string)
-    if res:
-        magnitude = int(res.group(1))
-        unit = res.group(2)
-        return magnitude * unit_in_ms[unit]
+def _time_string_to_ms(string, unit_in_ms, allow_negative=False):
+    magnitude, unit = string[:-1], string[-1:]
+    digits = magnitude[1:] if allow_negative and magnitude[:1] == "-" else magnitude
+    if unit in unit_in_ms and digits.isdecimal():
+        return int(magnitude) * unit_in_ms[unit]
     return None
 
 
+@lru_cache(maxsize=256)
 def granularity_to_ms(granularity: str) -> int:
-    ms = _time_string_to_ms(r"(\d+)({})", granularity, _unit_in_ms_without_week)
+    ms = _time_string_to_ms(granularity, _unit_in_ms_without_week)
     if ms is None:
         raise ValueError(
             "Invalid granularity format: `{}`. Must be on format <integer>(s|m|h|d). E.g. '5m', '3h' or '1d'.".format(
@@ -40,23 +35,25 @@ def granularity_to_ms(granularity: str) -> int:
     return ms
 
 
+@lru_cache(maxsize=256)
 def granularity_unit_to_ms(granularity: str) -> int:
-    granularity = re.sub(r"^\d+", "1", granularity)
-    return granularity_to_ms(granularity)
+    granularity_to_ms(granularity)
+    return _unit_in_ms_without_week[granularity[-1]]
 
 
+@lru_cache(maxsize=256)
 def _time_ago_to_ms(time_ago_string: str) -> int:
     """Returns millisecond representation of time-ago string"""
     if time_ago_string == "now":
         return 0
-    ms = _time_string_to_ms(r"(\d+)({})-ago", time_ago_string, _unit_in_ms)
-    if ms is None:
+    magnitude, unit, suffix = time_ago_string[:-5], time_ago_string[-5:-4], time_ago_string[-4:]
+    if suffix != "-ago" or unit not in _unit_in_ms or not magnitude.isdecimal():
         raise ValueError(
             "Invalid time-ago format: `{}`. Must be on format <integer>(s|m|h|d|w)-ago or 'now'. E.g. '3d-ago' or '1w-ago'.".format(
                 time_ago_string
             )
         )
-    return ms
+    return int(magnitude) * _unit_in_ms[unit]
 
 
 def _datetime_to_ms(dt):
@@ -76,7 +73,26 @@ class NowCache:
 
 def timestamp_to_ms(t: Union[int, str, datetime]):
     """Returns the ms representation of some timestamp given by milliseconds, time-ago format or datetime object"""
-    time_now = NowCache.get_time_now()
+    if type(t) is int and t >= 0:
+        return t
+    return _timestamp_to_ms(t, NowCache.get_time_now())
+
+
+def timestamps_to_ms(timestamps: Iterable[Union[int, str, datetime]]) -> List[int]:
+    """Returns the ms representation of several timestamps, resolving time-ago formats against the same time now"""
+    time_now = None
+    ms = []
+    for t in timestamps:
+        if type(t) is int and t >= 0:
+            ms.append(t)
+            continue
+        if time_now is None and isinstance(t, str):
+            time_now = NowCache.get_time_now()
+        ms.append(_timestamp_to_ms(t, time_now))
+    return ms
+
+
+def _timestamp_to_ms(t, time_now):
     if isinstance(t, int):
         ms = t
     elif isinstance(t, str):
@@ -94,8 +110,9 @@ def timestamp_to_ms(t: Union[int, str, datetime]):
     return ms
 
 
+@lru_cache(maxsize=256)
 def _time_interval_str_to_ms(interval_str: str):
-    ms = _time_string_to_ms(r"(\d+)({})", interval_str, _unit_in_ms)
+    ms = _time_string_to_ms(interval_str, _unit_in_ms)
     if ms is None:
         raise ValueError(
             "Invalid time interval format: `{}`. Must be on format <integer>(s|m|h|d|w). E.g. '5m', '3h' or '1d'.".format(
@@ -107,6 +124,8 @@ def _time_interval_str_to_ms(interval_str: str):
 
 def time_interval_to_ms(t: Union[int, str, timedelta], allow_zero=False, allow_inf=False):
     """Returns millisecond representation of time interval"""
+    if type(t) is int and t > 0:
+        return t
     if isinstance(t, int):
         ms = t
     elif isinstance(t, str):
@@ -131,8 +150,9 @@ def time_interval_to_ms(t: Union[int, str, timedelta], allow_zero=False, allow_i
     return ms
 
 
+@lru_cache(maxsize=256)
 def _time_offset_str_to_ms(offset_str: str):
-    ms = _time_string_to_ms(r"(-?\d+)({})", offset_str, _unit_in_ms)
+    ms = _time_string_to_ms(offset_str, _unit_in_ms, allow_negative=True)
     if ms is None:
         raise ValueError(
             "Invalid time offset format: `{}`. Must be on format [-]<integer>(s|m|h|d|w). E.g. '-5m', '-3h' or '1d'.".format(
@@ -1,5 +1,6 @@
 import json
 import re
+from copy import deepcopy
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
 
@@ -21,10 +22,13 @@ from cognite.model_hosting._cognite_model_hosting_common.utils import (
     granularity_unit_to_ms,
     time_interval_to_ms,
     timestamp_to_ms,
+    timestamps_to_ms,
 )
 from cognite.model_hosting.data_spec.exceptions import SpecValidationError
 
 INVALID_AGGREGATE_FUNCTIONS = ["avg", "cv", "dv", "int", "step", "tv"]
+_ALIAS_PATTERN = re.compile("[a-z]([a-z0-9_]{0,48}[a-z0-9])?")
+_SNAKE_CASE_PATTERN = re.compile(r"_(.)")
 
 
 class _BaseSpec:
@@ -101,7 +105,8 @@ class _BaseSpec:
         Raises:
             SpecValidationError: If the spec is not valid.
         """
-        return self.from_json(self.to_json())
+        self.validate()
+        return _copy_unshared(self)
 
     def __str__(self):
         return self.to_json()
@@ -113,6 +118,17 @@ class _BaseSpec:
             return False
 
 
+def _copy_unshared(value):
+    # Unlike deepcopy, specs referenced from several places are copied separately, as a dump/load round trip would.
+    if isinstance(value, _BaseSpec):
+        copied = value.__class__.__new__(value.__class__)
+        copied.__dict__.update(_copy_unshared(value.__dict__))
+        return copied
+    if isinstance(value, dict):
+        return {k: _copy_unshared(v) for k, v in value.items()}
+    return deepcopy(value)
+
+
 class TimeSeriesSpec(_BaseSpec):
     """Creates a time series spec.
 
@@ -140,8 +156,7 @@ class TimeSeriesSpec(_BaseSpec):
         granularity: str = None,
         include_outside_points: bool = None,
     ):
-        self.start = timestamp_to_ms(start)
-        self.end = timestamp_to_ms(end)
+        self.start, self.end = timestamps_to_ms([start, end])
         self.id = id
         self.external_id = external_id
         self.aggregate = aggregate
@@ -215,6 +230,20 @@ class DataSpec(_BaseSpec):
         self.metadata = metadata
         self.validate()
 
+    @classmethod
+    def _without_validation(
+        cls,
+        time_series: Optional[Dict[str, TimeSeriesSpec]] = None,
+        files: Optional[Dict[str, FileSpec]] = None,
+        metadata: Optional[DataSpecMetadata] = None,
+    ):
+        # For specs derived from an already validated spec, e.g. the windows of a ScheduleDataSpec.
+        data_spec = cls.__new__(cls)
+        data_spec.time_series = time_series or {}
+        data_spec.files = files or {}
+        data_spec.metadata = metadata
+        return data_spec
+
 
 class ScheduleInputTimeSeriesSpec(_BaseSpec):
     """Creates a ScheduleOutputTimeSeriesSpec.
@@ -266,23 +295,20 @@ class ScheduleInputSpec(_BaseSpec):
                 return True
         return False
 
-    def _largest_granularity(self):
-        largest = None
+    def _largest_granularity_and_unit(self):
+        largest, largest_unit = None, None
         for time_series_spec in self.time_series.values():
             if time_series_spec.aggregate:
                 ms = granularity_to_ms(time_series_spec.granularity)
+                unit_ms = granularity_unit_to_ms(time_series_spec.granularity)
                 if largest is None or ms > largest:
                     largest = ms
-        return largest
+                if largest_unit is None or unit_ms > largest_unit:
+                    largest_unit = unit_ms
+        return largest, largest_unit
 
     def _largest_granularity_unit(self):
-        largest = None
-        for time_series_spec in self.time_series.values():
-            if time_series_spec.aggregate:
-                ms = granularity_unit_to_ms(time_series_spec.granularity)
-                if largest is None or ms > largest:
-                    largest = ms
-        return largest
+        return self._largest_granularity_and_unit()[1]
 
 
 class ScheduleOutputTimeSeriesSpec(_BaseSpec):
@@ -381,7 +407,10 @@ class ScheduleDataSpec(_BaseSpec):
         Returns:
             List[DataSpec]: List of DataSpec objects, one for each prediction window.
         """
-        start, end = timestamp_to_ms(start), timestamp_to_ms(end)
+        start, end = timestamps_to_ms([start, end])
+        # Every window shares the input time series, aliases and settings of this spec, so validating it once covers
+        # all of the DataSpecs built below.
+        self.validate()
 
         windows = calculate_windows(
             start=start, end=end, stride=self.stride, window_size=self.window_size, first=self.start
@@ -402,7 +431,7 @@ class ScheduleDataSpec(_BaseSpec):
                 for alias, spec in self.input.time_series.items()
             }
             data_specs.append(
-                DataSpec(
+                DataSpec._without_validation(
                     time_series=time_series_specs,
                     metadata=DataSpecMetadata(
                         ScheduleSettings(stride=self.stride, window_size=self.window_size, start=start, end=end)
@@ -424,7 +453,7 @@ class ScheduleDataSpec(_BaseSpec):
         Returns:
             List[int]: A list of timestamps.
         """
-        start, end = timestamp_to_ms(start), timestamp_to_ms(end)
+        start, end = timestamps_to_ms([start, end])
 
         windows = calculate_windows(
             start=start, end=end, stride=self.stride, window_size=self.window_size, first=self.start
@@ -461,8 +490,7 @@ class AliasField(fields.String):
         super().__init__(required=True, validate=self.__validate)
 
     def __validate(self, field_name):
-        pattern = "[a-z]([a-z0-9_]{0,48}[a-z0-9])?"
-        if not re.fullmatch(pattern, field_name):
+        if not _ALIAS_PATTERN.fullmatch(field_name):
             raise ValidationError(
                 "Invalid alias. Must be 1 to 50 lowercase alphanumeric characters or `_`. Must start with a letter "
                 "and cannot end with `_` ."
@@ -605,16 +633,15 @@ class _ScheduleDataSpecSchema(_BaseSchema):
     def _validate_aggregate_constraints(data):
         errors = {}
 
-        largest_granularity_unit = data["input"]._largest_granularity_unit()
+        largest_granularity, largest_granularity_unit = data["input"]._largest_granularity_and_unit()
         for field in ["stride", "window_size", "start"]:
             if data[field] % largest_granularity_unit != 0:
                 # To correct for surprising behaviour in Marshmallow
-                field_camel_case = re.sub(r"_(.)", lambda m: m.group(1).upper(), field)
+                field_camel_case = _SNAKE_CASE_PATTERN.sub(lambda m: m.group(1).upper(), field)
                 errors[field_camel_case] = [
                     "Must be a multiple of the largest granularity unit in the input time series."
                 ]
 
-        largest_granularity = data["input"]._largest_granularity()
         if data["window_size"] < largest_granularity:
             errors["windowSize"] = [
                 "Must be greater than or equal to the largest granularity of any of aggregated input time series."
@@ -35,7 +35,7 @@ def to_output(dataframe: Union[pd.DataFrame, List[pd.DataFrame]]) -> Dict:
         output["timeSeries"] = _convert_df_to_output_format(dataframe)
     elif isinstance(dataframe, List):
         for df in dataframe:
-            if set(df.columns) - set(output["timeSeries"].keys()) != set(df.columns):
+            if not output["timeSeries"].keys().isdisjoint(df.columns):
                 raise DuplicateAliasInScheduledOutput("An alias has been provided multiple times")
             output["timeSeries"].update(_convert_df_to_output_format(df))
     else:
@@ -44,7 +44,8 @@ def to_output(dataframe: Union[pd.DataFrame, List[pd.DataFrame]]) -> Dict:
 
 
 def _convert_df_to_output_format(df: pd.DataFrame):
-    return {name: list(zip([timestamp_to_ms(ts) for ts in df.index], df[name])) for name in df.columns}
+    timestamps = [timestamp_to_ms(ts) for ts in df.index]
+    return {name: list(zip(timestamps, df[name].tolist())) for name in df.columns}
 
 
 class _ScheduleOutputSchema(Schema):
@@ -82,27 +83,32 @@ class ScheduleOutput:
     def _validate_alias(self, type: str, alias: str):
         assert self._output.get(type, {}).get(alias) is not None, "{} is not a valid alias".format(alias)
 
-    def _validate_aligned(self, aliases: List[str]):
-        timestamps = set()
+    def _get_points(self, alias: str) -> np.ndarray:
+        return np.array(self._output["timeSeries"][alias], dtype=np.float64).reshape(-1, 2)
+
+    @staticmethod
+    def _to_index(timestamps: np.ndarray) -> np.ndarray:
+        return timestamps.astype(np.int64).astype("datetime64[ms]")
+
+    def _validate_aligned(self, aliases: List[str]) -> Dict[str, np.ndarray]:
+        points = {}
         for alias in aliases:
             self._validate_alias("timeSeries", alias)
-            timestamps.add(tuple(point[0] for point in self._output["timeSeries"][alias]))
-        assert 1 == len(timestamps), "Timestamps for aliases {} are not aligned".format(aliases)
+            points[alias] = self._get_points(alias)
+        timestamps = [p[:, 0] for p in points.values()]
+        aligned = len(timestamps) > 0 and all(np.array_equal(timestamps[0], t) for t in timestamps[1:])
+        assert aligned, "Timestamps for aliases {} are not aligned".format(aliases)
+        return points
 
     def _get_dataframe_single_alias(self, alias) -> pd.DataFrame:
         self._validate_alias("timeSeries", alias)
-        data = self._output["timeSeries"][alias]
-        timestamps = [int(point[0]) for point in data]
-        datapoints = [point[1] for point in data]
-        return pd.DataFrame({alias: datapoints}, index=np.array(timestamps, dtype="datetime64[ms]"))
+        points = self._get_points(alias)
+        return pd.DataFrame({alias: points[:, 1]}, index=self._to_index(points[:, 0]))
 
     def _get_dataframe_multiple_aliases(self, aliases: List[str]) -> pd.DataFrame:
-        self._validate_aligned(aliases)
-        data = {}
-        timestamps = [int(p[0]) for p in self._output["timeSeries"][aliases[0]]]
-        for a in aliases:
-            data[a] = [p[1] for p in self._output["timeSeries"][a]]
-        return pd.DataFrame(data, index=np.array(timestamps, dtype="datetime64[ms]"))
+        points = self._validate_aligned(aliases)
+        data = {a: points[a][:, 1] for a in aliases}
+        return pd.DataFrame(data, index=self._to_index(points[aliases[0]][:, 0]))
 
     def get_dataframe(self, alias: Union[str, List[str]]) -> pd.DataFrame:
         """Returns a time-aligned dataframe of the specified alias(es).
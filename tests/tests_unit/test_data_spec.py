@@ -1,8 +1,6 @@
 import json
-import time
 from collections import namedtuple
 from datetime import datetime, timedelta
-from unittest import mock
 
 import pytest
 
@@ -19,46 +17,46 @@ from cognite.model_hosting.data_spec import (
 from cognite.model_hosting.data_spec.data_spec import DataSpecMetadata, ScheduleSettings
 from cognite.model_hosting.data_spec.exceptions import SpecValidationError
 
+TIME_SERIES_PRIMITIVE = {"id": 6, "start": 123, "end": 234}
+
 
 class TestSpecValidation:
-    TestCase = namedtuple("TestCase", ["name", "obj", "primitive"])
+    TestCase = namedtuple("TestCase", ["name", "constructor", "primitive"])
     InvalidTestCase = namedtuple("TestCase", ["name", "type", "constructor", "primitive", "errors"])
 
     valid_test_cases = [
-        TestCase("minimal_file_spec", FileSpec(id=6), {"id": 6}),
-        TestCase("minimal_file_spec_external_id", FileSpec(external_id="abc"), {"externalId": "abc"}),
-        TestCase(
-            "minimal_time_series_spec", TimeSeriesSpec(id=6, start=123, end=234), {"id": 6, "start": 123, "end": 234}
-        ),
+        TestCase("minimal_file_spec", lambda: FileSpec(id=6), {"id": 6}),
+        TestCase("minimal_file_spec_external_id", lambda: FileSpec(external_id="abc"), {"externalId": "abc"}),
+        TestCase("minimal_time_series_spec", lambda: TimeSeriesSpec(id=6, start=123, end=234), TIME_SERIES_PRIMITIVE),
         TestCase(
             "time_series_include_outside_points",
-            TimeSeriesSpec(id=6, start=123, end=234, include_outside_points=True),
-            {"id": 6, "start": 123, "end": 234, "includeOutsidePoints": True},
+            lambda: TimeSeriesSpec(id=6, start=123, end=234, include_outside_points=True),
+            {**TIME_SERIES_PRIMITIVE, "includeOutsidePoints": True},
         ),
         TestCase(
             "time_series_aggregate",
-            TimeSeriesSpec(id=6, start=123, end=234, aggregate="average", granularity="1m"),
-            {"id": 6, "start": 123, "end": 234, "aggregate": "average", "granularity": "1m"},
+            lambda: TimeSeriesSpec(id=6, start=123, end=234, aggregate="average", granularity="1m"),
+            {**TIME_SERIES_PRIMITIVE, "aggregate": "average", "granularity": "1m"},
         ),
         TestCase(
             "time_series_external_id",
-            TimeSeriesSpec(external_id="abc", start=123, end=234, aggregate="average", granularity="1m"),
+            lambda: TimeSeriesSpec(external_id="abc", start=123, end=234, aggregate="average", granularity="1m"),
             {"externalId": "abc", "start": 123, "end": 234, "aggregate": "average", "granularity": "1m"},
         ),
         TestCase(
             "schedule_input_time_series",
-            ScheduleInputTimeSeriesSpec(id=6, aggregate="average", granularity="1m"),
+            lambda: ScheduleInputTimeSeriesSpec(id=6, aggregate="average", granularity="1m"),
             {"id": 6, "aggregate": "average", "granularity": "1m"},
         ),
         TestCase(
             "schedule_input_time_series_external_id",
-            ScheduleInputTimeSeriesSpec(external_id="abc", aggregate="average", granularity="1m"),
+            lambda: ScheduleInputTimeSeriesSpec(external_id="abc", aggregate="average", granularity="1m"),
             {"externalId": "abc", "aggregate": "average", "granularity": "1m"},
         ),
-        TestCase("empty_data_spec", DataSpec(), {}),
+        TestCase("empty_data_spec", lambda: DataSpec(), {}),
         TestCase(
             "full_data_spec",
-            DataSpec(
+            lambda: DataSpec(
                 time_series={
                     "ts1": TimeSeriesSpec(id=6, start=123, end=234),
                     "ts2": TimeSeriesSpec(id=7, start=1234, end=2345),
@@ -66,21 +64,18 @@ class TestSpecValidation:
                 files={"f1": FileSpec(id=3), "f2": FileSpec(id=4)},
             ),
             {
-                "timeSeries": {
-                    "ts1": {"id": 6, "start": 123, "end": 234},
-                    "ts2": {"id": 7, "start": 1234, "end": 2345},
-                },
+                "timeSeries": {"ts1": TIME_SERIES_PRIMITIVE, "ts2": {"id": 7, "start": 1234, "end": 2345}},
                 "files": {"f1": {"id": 3}, "f2": {"id": 4}},
             },
         ),
         TestCase(
             "data_spec_with_metadata",
-            DataSpec(metadata=DataSpecMetadata(ScheduleSettings(stride=1, window_size=1, start=1, end=2))),
+            lambda: DataSpec(metadata=DataSpecMetadata(ScheduleSettings(stride=1, window_size=1, start=1, end=2))),
             {"metadata": {"scheduleSettings": {"stride": 1, "windowSize": 1, "start": 1, "end": 2}}},
         ),
         TestCase(
             "full_data_spec_with_metadata",
-            DataSpec(
+            lambda: DataSpec(
                 time_series={
                     "ts1": TimeSeriesSpec(id=6, start=123, end=234),
                     "ts2": TimeSeriesSpec(id=7, start=1234, end=2345),
@@ -89,36 +84,33 @@ class TestSpecValidation:
                 metadata=DataSpecMetadata(ScheduleSettings(stride=1, window_size=1, start=1, end=2)),
             ),
             {
-                "timeSeries": {
-                    "ts1": {"id": 6, "start": 123, "end": 234},
-                    "ts2": {"id": 7, "start": 1234, "end": 2345},
-                },
+                "timeSeries": {"ts1": TIME_SERIES_PRIMITIVE, "ts2": {"id": 7, "start": 1234, "end": 2345}},
                 "files": {"f1": {"id": 3}, "f2": {"id": 4}},
                 "metadata": {"scheduleSettings": {"stride": 1, "windowSize": 1, "start": 1, "end": 2}},
             },
         ),
-        TestCase("minimal_schedule_input_spec", ScheduleInputSpec(), {}),
+        TestCase("minimal_schedule_input_spec", lambda: ScheduleInputSpec(), {}),
         TestCase(
             "full_schedule_input_spec",
-            ScheduleInputSpec(
+            lambda: ScheduleInputSpec(
                 time_series={"ts1": ScheduleInputTimeSeriesSpec(id=6), "ts2": ScheduleInputTimeSeriesSpec(id=7)}
             ),
             {"timeSeries": {"ts1": {"id": 6}, "ts2": {"id": 7}}},
         ),
         TestCase(
             "schedule_output_time_series_spec",
-            ScheduleOutputTimeSeriesSpec(id=123, offset=-5),
+            lambda: ScheduleOutputTimeSeriesSpec(id=123, offset=-5),
             {"id": 123, "offset": -5},
         ),
         TestCase(
             "schedule_output_time_series_spec_external_id",
-            ScheduleOutputTimeSeriesSpec(external_id="abc", offset=-5),
+            lambda: ScheduleOutputTimeSeriesSpec(external_id="abc", offset=-5),
             {"externalId": "abc", "offset": -5},
         ),
-        TestCase("minimal_schedule_output_spec", ScheduleOutputSpec(), {}),
+        TestCase("minimal_schedule_output_spec", lambda: ScheduleOutputSpec(), {}),
         TestCase(
             "full_schedule_output_spec",
-            ScheduleOutputSpec(
+            lambda: ScheduleOutputSpec(
                 time_series={
                     "ts1": ScheduleOutputTimeSeriesSpec(id=123, offset=5),
                     "ts2": ScheduleOutputTimeSeriesSpec(id=234, offset=0),
@@ -128,12 +120,14 @@ class TestSpecValidation:
         ),
         TestCase(
             "minimal_schedule_data_spec",
-            ScheduleDataSpec(input=ScheduleInputSpec(), output=ScheduleOutputSpec(), stride=1, window_size=2, start=3),
+            lambda: ScheduleDataSpec(
+                input=ScheduleInputSpec(), output=ScheduleOutputSpec(), stride=1, window_size=2, start=3
+            ),
             {"input": {}, "output": {}, "stride": 1, "windowSize": 2, "start": 3, "slack": 0},
         ),
         TestCase(
             "full_schedule_data_spec",
-            ScheduleDataSpec(
+            lambda: ScheduleDataSpec(
                 input=ScheduleInputSpec(time_series={"ts1": ScheduleInputTimeSeriesSpec(id=5)}),
                 output=ScheduleOutputSpec(time_series={"ts1": ScheduleOutputTimeSeriesSpec(id=123, offset=100)}),
                 stride=1,
@@ -152,7 +146,7 @@ class TestSpecValidation:
         ),
         TestCase(
             "schedule_data_spec_with_aggregates",
-            ScheduleDataSpec(
+            lambda: ScheduleDataSpec(
                 input=ScheduleInputSpec(
                     time_series={
                         "ts1": ScheduleInputTimeSeriesSpec(id=5, aggregate="average", granularity="3h"),
@@ -237,7 +231,7 @@ class TestSpecValidation:
             name="time_series_aggregates_but_not_granularity",
             type=TimeSeriesSpec,
             constructor=lambda: TimeSeriesSpec(id=6, start=123, end=234, aggregate="average"),
-            primitive={"id": 6, "start": 123, "end": 234, "aggregate": "average"},
+            primitive={**TIME_SERIES_PRIMITIVE, "aggregate": "average"},
             errors={"granularity": ["granularity must be specified for aggregates."]},
         ),
         InvalidTestCase(
@@ -247,9 +241,7 @@ class TestSpecValidation:
                 id=6, start=123, end=234, aggregate="average", granularity="1m", include_outside_points=True
             ),
             primitive={
-                "id": 6,
-                "start": 123,
-                "end": 234,
+                **TIME_SERIES_PRIMITIVE,
                 "aggregate": "average",
                 "granularity": "1m",
                 "includeOutsidePoints": True,
@@ -260,7 +252,7 @@ class TestSpecValidation:
             name="time_series_invalid_aggregate_function",
             type=TimeSeriesSpec,
             constructor=lambda: TimeSeriesSpec(id=6, start=123, end=234, aggregate="avg", granularity="1m"),
-            primitive={"id": 6, "start": 123, "end": 234, "aggregate": "avg", "granularity": "1m"},
+            primitive={**TIME_SERIES_PRIMITIVE, "aggregate": "avg", "granularity": "1m"},
             errors={
                 "aggregate": ["Not a valid aggregate function. Cannot use shorthand name."],
                 "granularity": ["granularity can only be specified for aggregates."],
@@ -270,14 +262,14 @@ class TestSpecValidation:
             name="time_series_not_aggregate_but_granularity",
             type=TimeSeriesSpec,
             constructor=lambda: TimeSeriesSpec(id=6, start=123, end=234, granularity="1m"),
-            primitive={"id": 6, "start": 123, "end": 234, "granularity": "1m"},
+            primitive={**TIME_SERIES_PRIMITIVE, "granularity": "1m"},
             errors={"granularity": ["granularity can only be specified for aggregates."]},
         ),
         InvalidTestCase(
             name="time_series_invalid_granularity",
             type=TimeSeriesSpec,
             constructor=lambda: TimeSeriesSpec(id=6, start=123, end=234, granularity="bla"),
-            primitive={"id": 6, "start": 123, "end": 234, "granularity": "bla"},
+            primitive={**TIME_SERIES_PRIMITIVE, "granularity": "bla"},
             errors={
                 "granularity": [
                     "Invalid granularity format: `bla`. Must be on format <integer>(s|m|h|d). E.g. '5m', '3h' or '1d'."
@@ -429,27 +421,28 @@ class TestSpecValidation:
         ),
     ]
 
-    @pytest.mark.parametrize("name, obj, primitive", valid_test_cases)
-    def test_valid_dump(self, name, obj, primitive):
+    @pytest.fixture(params=valid_test_cases, ids=[case.name for case in valid_test_cases])
+    def valid_case(self, request):
+        primitive = request.param.primitive
+        return request.param.constructor(), primitive, json.dumps(primitive, indent=4, sort_keys=True)
+
+    def test_valid_dump_load(self, valid_case):
+        obj, primitive, _ = valid_case
         dumped = obj.dump()
         assert dumped == primitive
-
-    @pytest.mark.parametrize("name, obj, primitive", valid_test_cases)
-    def test_valid_load(self, name, obj, primitive):
         loaded = obj.__class__.load(primitive)
         assert loaded == obj
 
-    @pytest.mark.parametrize("name, obj, primitive", valid_test_cases)
-    def test_valid_json_serializable(self, name, obj, primitive):
-        json_data = obj.to_json()
-        from_json = obj.__class__.from_json(json_data)
+    def test_valid_json_serializable(self, valid_case):
+        obj, _, expected_json = valid_case
+        from_json = obj.__class__.from_json(expected_json)
         assert from_json == obj, "\nFrom JSON: ({})\n{}\nObj:({})\n{}\n".format(
             type(from_json), from_json, type(obj), obj
         )
 
     def test_load_with_unknown_fields(self):
         primitive = {
-            "timeSeries": {"ts1": {"id": 6, "start": 123, "end": 234}, "ts2": {"id": 7, "start": 1234, "end": 2345}},
+            "timeSeries": {"ts1": TIME_SERIES_PRIMITIVE, "ts2": {"id": 7, "start": 1234, "end": 2345}},
             "files": {"f1": {"id": 3}, "f2": {"id": 4}},
             "metadata": {"scheduleSettings": {"stride": 1, "windowSize": 1, "start": 1, "end": 2}},
             "unkown_field": "blabla",
@@ -461,11 +454,18 @@ class TestSpecValidation:
         assert "unkown_field" not in ds.dump()
 
     def remove_defaultdict_in_errors(self, d):
-        return json.loads(json.dumps(d))
-
-    @pytest.mark.parametrize("name, type, constructor, primitive, errors", invalid_test_cases)
+        if isinstance(d, dict):
+            return {k: self.remove_defaultdict_in_errors(v) for k, v in d.items()}
+        if isinstance(d, list):
+            return [self.remove_defaultdict_in_errors(v) for v in d]
+        return d
+
+    @pytest.mark.parametrize(
+        "name, type, constructor, primitive, errors", invalid_test_cases, ids=[case.name for case in invalid_test_cases]
+    )
     def test_invalid(self, name, type, constructor, primitive, errors):
-        should_fail = {"load": lambda: type.load(primitive), "from_json": lambda: type.from_json(json.dumps(primitive))}
+        primitive_json = json.dumps(primitive)
+        should_fail = {"load": lambda: type.load(primitive), "from_json": lambda: type.from_json(primitive_json)}
         if constructor is not None:
             if type in (DataSpec, ScheduleDataSpec):
                 should_fail["constructor"] = constructor
@@ -481,9 +481,9 @@ class TestSpecValidation:
             if actual_errors != errors:
                 pytest.fail("\nMethod: {}\nErrors:\n{}\nExpected:\n{}\n".format(name, actual_errors, errors))
 
-    @pytest.mark.parametrize("name, obj, primitive", valid_test_cases)
-    def test_valid_str_repr(self, name, obj, primitive):
-        assert str(obj) == obj.to_json()
+    def test_valid_str_repr(self, valid_case):
+        obj, _, expected_json = valid_case
+        assert str(obj) == expected_json
 
 
 def test_validation_exception_str_repr():
@@ -502,13 +502,24 @@ def test_copy():
     assert data_spec != data_spec_copied
 
 
-class TestSpecConstructor:
-    @pytest.fixture(autouse=True, scope="class")
-    def mock_time(self):
-        with mock.patch("cognite.model_hosting._cognite_model_hosting_common.utils.time.time") as m:
-            m.return_value = 10 ** 6
-            yield
+def test_copy_does_not_share_specs():
+    time_series_spec = TimeSeriesSpec(id=6, start=123, end=234)
+    data_spec_copied = DataSpec(time_series={"a": time_series_spec, "b": time_series_spec}).copy()
+
+    data_spec_copied.time_series["a"].start = 99
+
+    assert 123 == data_spec_copied.time_series["b"].start
+    assert 123 == time_series_spec.start
 
+
+def test_copy_invalid():
+    file_spec = FileSpec(id=123)
+    file_spec.external_id = "abc"
+    with pytest.raises(SpecValidationError):
+        file_spec.copy()
+
+
+class TestSpecConstructor:
     TestCase = namedtuple("TestCase", ["name", "constructor", "primitive"])
     InvalidTestCase = namedtuple("InvalidTestCase", ["name", "constructor", "exception", "error_match"])
 
@@ -592,24 +603,28 @@ class TestSpecConstructor:
         ),
     ]
 
-    @pytest.mark.parametrize("name, constructor, primitive", test_cases)
-    def test_valid(self, name, constructor, primitive):
+    @pytest.mark.parametrize("name, constructor, primitive", test_cases, ids=[case.name for case in test_cases])
+    def test_valid(self, monkeypatch, name, constructor, primitive):
+        monkeypatch.setattr("cognite.model_hosting._cognite_model_hosting_common.utils.time.time", lambda: 10 ** 6)
         spec = constructor()
         assert spec.dump() == primitive
 
-    @pytest.mark.parametrize("name, constructor, exception, error_match", invalid_test_cases)
+    @pytest.mark.parametrize(
+        "name, constructor, exception, error_match", invalid_test_cases, ids=[case.name for case in invalid_test_cases]
+    )
     def test_invalid(self, name, constructor, exception, error_match):
         with pytest.raises(exception, match=error_match):
             constructor()
 
 
 class TestSpecWithTimeAgoFormat:
-    def test_create_multiple_ts_specs_aligned_start_end(self):
+    def test_create_multiple_ts_specs_aligned_start_end(self, monkeypatch):
+        monkeypatch.setattr("cognite.model_hosting._cognite_model_hosting_common.utils.time.time", lambda: 10 ** 6)
         specs_before = []
         for i in range(30):
             specs_before.append(TimeSeriesSpec(id=i, start="1d-ago", end="now"))
 
-        time.sleep(0.2)
+        monkeypatch.setattr("cognite.model_hosting._cognite_model_hosting_common.utils.time.time", lambda: 10 ** 6 + 1)
 
         specs_after = []
         for i in range(30):
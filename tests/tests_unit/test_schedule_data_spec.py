@@ -13,7 +13,8 @@ from cognite.model_hosting.data_spec import (
     ScheduleOutputSpec,
     TimeSeriesSpec,
 )
-from cognite.model_hosting.data_spec.data_spec import DataSpecMetadata, ScheduleSettings, _ScheduleDataSpecSchema
+from cognite.model_hosting.data_spec.data_spec import DataSpecMetadata, ScheduleSettings
+from cognite.model_hosting.data_spec.exceptions import SpecValidationError
 
 
 class TestCalculateWindowIntervals:
@@ -69,6 +70,20 @@ def test_get_instances(ids, ext_ids):
     assert len(expected_data_specs) == len(data_specs)
     for expected, actual in zip(expected_data_specs, data_specs):
         assert expected == actual
+        actual.validate()
+
+
+def test_get_instances_invalid_schedule_data_spec():
+    schedule_data_spec = ScheduleDataSpec(
+        input=ScheduleInputSpec(time_series={"ts1": ScheduleInputTimeSeriesSpec(id=1)}),
+        output=ScheduleOutputSpec(),
+        stride="1m",
+        window_size="1m",
+        start=60000,
+    )
+    schedule_data_spec.input.time_series["ts1"].external_id = "abc"
+    with pytest.raises(SpecValidationError):
+        schedule_data_spec.get_instances(start=60000, end=6 * 60000)
 
 
 class TestGetScheduleTimestamps:
@@ -159,13 +174,13 @@ class TestValidateGranularityConstraints:
     @pytest.mark.parametrize("test_case", VALID_CASES)
     def test_valid(self, test_case):
         spec = self._create_schedule_data_spec(test_case)
-        _ScheduleDataSpecSchema()._validate(spec)
+        ScheduleDataSpec._schema._validate(spec)
 
     @pytest.mark.parametrize("test_case", INVALID_CASES)
     def test_invalid(self, test_case):
         spec = self._create_schedule_data_spec(test_case)
         with pytest.raises(ValidationError):
-            _ScheduleDataSpecSchema()._validate(spec)
+            ScheduleDataSpec._schema._validate(spec)
 
 
 class TestStartAggregateConstraint:
@@ -1,5 +1,4 @@
 from datetime import datetime, timedelta
-from time import sleep
 from unittest import mock
 
 import pytest
@@ -10,6 +9,7 @@ from cognite.model_hosting._cognite_model_hosting_common.utils import (
     time_interval_to_ms,
     time_offset_to_ms,
     timestamp_to_ms,
+    timestamps_to_ms,
 )
 
 
@@ -49,7 +49,19 @@ class TestTimestampToMs:
 
         assert timestamp_to_ms(time_ago_string) == expected_timestamp
 
-    @pytest.mark.parametrize("time_ago_string", ["1s", "4h", "13m-ag", "13m ago", "bla"])
+    @mock.patch("cognite.model_hosting._cognite_model_hosting_common.utils.time.time")
+    def test_multiple_timestamps(self, time_mock):
+        time_mock.side_effect = [10 ** 9, 10 ** 9 + 1]
+        assert [10 ** 12, 10 ** 12 - 60 * 1000, 1514764800000, 123] == timestamps_to_ms(
+            ["now", "1m-ago", datetime(2018, 1, 1), 123]
+        )
+
+    @mock.patch("cognite.model_hosting._cognite_model_hosting_common.utils.time.time")
+    def test_multiple_timestamps_without_time_ago(self, time_mock):
+        assert [123, 1514764800000] == timestamps_to_ms([123, datetime(2018, 1, 1)])
+        time_mock.assert_not_called()
+
+    @pytest.mark.parametrize("time_ago_string", ["1s", "4h", "13m-ag", "13m ago", "13x-ago", "m-ago", "-ago", "bla"])
     def test_invalid(self, time_ago_string):
         with pytest.raises(ValueError, match=time_ago_string):
             timestamp_to_ms(time_ago_string)
@@ -59,10 +71,12 @@ class TestTimestampToMs:
         time_now = timestamp_to_ms("now")
         assert abs(expected_time_now - time_now) < 10
 
-        sleep(0.2)
-
-        time_now = timestamp_to_ms("now")
-        assert abs(expected_time_now - time_now) > 190
+    @mock.patch("cognite.model_hosting._cognite_model_hosting_common.utils.time.time")
+    def test_time_ago_advances_with_clock(self, time_mock):
+        time_mock.side_effect = [10 ** 9, 10 ** 9 + 0.2]
+        t1 = timestamp_to_ms("now")
+        t2 = timestamp_to_ms("now")
+        assert 200 == t2 - t1
 
     @pytest.mark.parametrize("t", [-1, datetime(1969, 12, 31), "100000000w-ago"])
     def test_negative(self, t):
@@ -116,7 +130,7 @@ class TestTimeIntervalToMs:
     def test_time_interval_string(self, time_interval_string, expected_ms):
         assert time_interval_to_ms(time_interval_string) == expected_ms
 
-    @pytest.mark.parametrize("time_interval_string", ["-3h", "13m-ago", "13", "bla"])
+    @pytest.mark.parametrize("time_interval_string", ["-3h", "13m-ago", "13", "h", "1 h", "bla"])
     def test_time_interval_string_invalid(self, time_interval_string):
         with pytest.raises(ValueError, match=time_interval_string):
             time_interval_to_ms(time_interval_string)
@@ -139,14 +153,13 @@ class TestTimeIntervalToMs:
         with pytest.raises(ValueError, match="positive"):
             time_interval_to_ms(0)
 
-    def test_allow_zero_and_inf(self):
-        time_interval_to_ms(0, allow_zero=True, allow_inf=True)
-        time_interval_to_ms("0h", allow_zero=True, allow_inf=True)
-        time_interval_to_ms(timedelta(hours=0), allow_zero=True, allow_inf=True)
-        time_interval_to_ms(-1, allow_zero=True, allow_inf=True)
-        time_interval_to_ms(timedelta(hours=0), allow_zero=True, allow_inf=True)
-        with pytest.raises(ValueError, match="positive"):
-            time_interval_to_ms(-2)
+    @pytest.mark.parametrize("time_interval", [0, "0h", timedelta(hours=0), -1, timedelta(milliseconds=-1)])
+    def test_allow_zero_and_inf(self, time_interval):
+        time_interval_to_ms(time_interval, allow_zero=True, allow_inf=True)
+
+    def test_allow_zero_and_inf_invalid(self):
+        with pytest.raises(ValueError, match="-1, 0 or positive"):
+            time_interval_to_ms(-2, allow_zero=True, allow_inf=True)
 
 
 class TestGranularityToMs:
@@ -227,7 +240,7 @@ class TestTimeOffsetToMs:
     def test_time_offset_string(self, time_offset_string, expected_ms):
         assert time_offset_to_ms(time_offset_string) == expected_ms
 
-    @pytest.mark.parametrize("time_offset_string", ["13m-ago", "13", "bla"])
+    @pytest.mark.parametrize("time_offset_string", ["13m-ago", "13", "-h", "--3h", "bla"])
     def test_time_offset_string_invalid(self, time_offset_string):
         with pytest.raises(ValueError, match=time_offset_string):
             time_offset_to_ms(time_offset_string)